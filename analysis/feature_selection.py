@@ -14,25 +14,72 @@ from sklearn.linear_model import ElasticNetCV, ElasticNet
 from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import cross_val_score
 from sklearn.metrics import r2_score, mean_squared_error
-from statsmodels.stats.outliers_influence import variance_inflation_factor
 from scipy import stats
+from joblib import Parallel, delayed
 import os
 
 np.random.seed(42)
 
 
+def _inverse_corr(X):
+    """Invert the feature correlation matrix; degenerate columns get VIF = inf."""
+    A = np.asarray(X, dtype=float)
+    k = A.shape[1]
+    inv = np.full((k, k), np.inf)
+    # Zero-variance columns have no defined correlation; leave them at inf
+    ok = A.std(axis=0, ddof=1) >= 1e-12
+    if not ok.any():
+        return inv
+    C = np.atleast_2d(np.corrcoef(A[:, ok], rowvar=False))
+    try:
+        C_inv = np.linalg.inv(C)
+    except np.linalg.LinAlgError:
+        # Exactly collinear: pseudo-inverse, then flag columns in the null space
+        C_inv = np.linalg.pinv(C, hermitian=True)
+        w, V = np.linalg.eigh(C)
+        null = V[:, w < 1e-10 * w.max()]
+        collinear = np.flatnonzero((np.abs(null) > 1e-8).any(axis=1))
+        C_inv[collinear, collinear] = np.inf
+    inv[np.ix_(ok, ok)] = C_inv
+    return inv
+
+
+def _vif_frame(columns, inv):
+    """VIF_i is the i-th diagonal entry of the inverse correlation matrix."""
+    vif = np.diag(inv).copy()
+    vif[~np.isfinite(vif) | (vif < 0) | (vif >= 1e10)] = np.inf
+    return pd.DataFrame({'feature': list(columns), 'VIF': vif}).sort_values('VIF', ascending=False)
+
+
 def calculate_vif(X):
     """Calculate VIF for standardized features."""
-    X_scaled = StandardScaler().fit_transform(X)
-    vif = []
-    for i in range(X_scaled.shape[1]):
-        try:
-            v = variance_inflation_factor(X_scaled, i)
-            v = v if np.isfinite(v) and v < 1e10 else np.inf
-        except:
-            v = np.inf
-        vif.append({'feature': X.columns[i], 'VIF': v})
-    return pd.DataFrame(vif).sort_values('VIF', ascending=False)
+    return _vif_frame(X.columns, _inverse_corr(X))
+
+
+def rank_by_correlation(X, y, k):
+    """Top-k columns of X by |Pearson r| with y; returns (names, r Series)."""
+    A = X.to_numpy(dtype=np.float64)
+    A = (A - A.mean(axis=0)) / A.std(axis=0, ddof=1)
+    b = y.to_numpy(dtype=np.float64)
+    b = (b - b.mean()) / b.std(ddof=1)
+    r = A.T @ b / (len(b) - 1)
+    k = min(k, len(r))
+    top = np.argpartition(-np.abs(r), k - 1)[:k]
+    top = top[np.argsort(-np.abs(r[top]))]
+    return X.columns[top].tolist(), pd.Series(r, index=X.columns)
+
+
+def _boot_iter(idx, X, y, alpha, l1_ratio, coef_init):
+    """Fit one bootstrap replicate on rows idx; returns (R², coefficients)."""
+    # Start coordinate descent from the full-sample solution
+    m = ElasticNet(alpha=alpha, l1_ratio=l1_ratio, max_iter=5000, warm_start=True)
+    m.coef_ = coef_init.copy()
+    Xb, yb = X[idx], y[idx]
+    m.fit(Xb, yb)
+    # R² from two dot products, skipping predict()/r2_score() validation
+    resid = yb - (Xb @ m.coef_ + m.intercept_)
+    dev = yb - yb.mean()
+    return 1 - (resid @ resid) / (dev @ dev), m.coef_
 
 
 def iterative_vif_removal(df, features, threshold=10):
@@ -43,6 +90,8 @@ def iterative_vif_removal(df, features, threshold=10):
         X = df[current].dropna()
         if X.shape[1] < 2:
             break
+        # Re-invert every round: a downdated inverse of a near-singular
+        # matrix carries its error into every later VIF
         vif_df = calculate_vif(X)
         if vif_df.iloc[0]['VIF'] <= threshold:
             break
@@ -67,14 +116,12 @@ def main():
     print(f"OST features: {len(ost_features)}")
     
     # Feature selection: Top 15 by |correlation| -> VIF < 10
-    correlations = [(f, abs(df[f].corr(y)), df[f].corr(y)) for f in ost_features]
-    correlations.sort(key=lambda x: x[1], reverse=True)
+    top_15, correlations = rank_by_correlation(df[ost_features], y, 15)
     
     print("\nTop 15 features by |r|:")
-    for i, (f, _, r) in enumerate(correlations[:15], 1):
-        print(f"  {i:2d}. {f:40s} r = {r:+.3f}")
+    for i, f in enumerate(top_15, 1):
+        print(f"  {i:2d}. {f:40s} r = {correlations[f]:+.3f}")
     
-    top_15 = [f for f, _, _ in correlations[:15]]
     final_features, removed = iterative_vif_removal(df, top_15.copy(), threshold=10)
     
     print(f"\nRemoved {len(removed)} features:")
@@ -90,7 +137,7 @@ def main():
     model = ElasticNetCV(
         l1_ratio=[0.1, 0.3, 0.5, 0.7, 0.9],
         alphas=np.logspace(-3, 1, 30),
-        cv=10, max_iter=5000, random_state=42
+        cv=10, max_iter=5000, random_state=42, n_jobs=-1
     )
     model.fit(X_scaled, y)
     
@@ -127,25 +174,28 @@ def main():
     
     THRESH = 0.05
     n_boot = 1000
-    boot_r2 = []
-    selection_count = {f: 0 for f in final_features}
-    
-    for i in range(n_boot):
-        idx = np.random.choice(len(y), len(y), replace=True)
-        m = ElasticNet(alpha=model.alpha_, l1_ratio=model.l1_ratio_, max_iter=5000)
-        m.fit(X_scaled[idx], y.iloc[idx])
-        boot_r2.append(r2_score(y.iloc[idx], m.predict(X_scaled[idx])))
-        for j, f in enumerate(final_features):
-            if abs(m.coef_[j]) > THRESH:
-                selection_count[f] += 1
-    
-    boot_r2 = np.array(boot_r2)
+    y_arr = y.to_numpy(copy=False)
+    rng = np.random.default_rng(42)
+    all_idx = rng.integers(0, len(y), size=(n_boot, len(y)), dtype=np.int32)
+    # Replicates are independent, so fan them out across all cores
+    results = Parallel(n_jobs=-1, backend="loky")(
+        delayed(_boot_iter)(idx, X_scaled, y_arr, model.alpha_, model.l1_ratio_, model.coef_)
+        for idx in all_idx
+    )
+    
+    boot_r2 = np.empty(n_boot)
+    coef_matrix = np.empty((n_boot, len(final_features)), dtype=np.float32)
+    for i, (r2_b, coef) in enumerate(results):
+        boot_r2[i] = r2_b
+        coef_matrix[i] = coef
+    selection_freq = (np.abs(coef_matrix) > THRESH).mean(axis=0)
+    
     print(f"R² 95% CI: [{np.percentile(boot_r2, 2.5):.3f}, {np.percentile(boot_r2, 97.5):.3f}]")
     
-    cv_scores = cross_val_score(model, X_scaled, y, cv=10, scoring='r2')
+    cv_scores = cross_val_score(model, X_scaled, y, cv=10, scoring='r2', n_jobs=-1)
     print(f"CV R² = {cv_scores.mean():.3f} ± {cv_scores.std():.3f}")
     
-    stability = pd.DataFrame([{'feature': f, 'freq': c/n_boot} for f, c in selection_count.items()])
+    stability = pd.DataFrame({'feature': final_features, 'freq': selection_freq})
     stability = stability.sort_values('freq', ascending=False)
     
     print(f"\nFeature stability (|β| > {THRESH}):")
@@ -170,13 +220,11 @@ def main():
     # Native model (top 6)
     native_df = df[native]
     y_n = native_df[target]
-    corrs_n = [(f, abs(native_df[f].corr(y_n))) for f in ost_features]
-    corrs_n.sort(key=lambda x: x[1], reverse=True)
-    native_feats = [f for f, _ in corrs_n[:6]]
+    native_feats, _ = rank_by_correlation(native_df[ost_features], y_n, 6)
     
     X_n = StandardScaler().fit_transform(native_df[native_feats])
     m_n = ElasticNetCV(l1_ratio=[0.1,0.3,0.5,0.7,0.9], alphas=np.logspace(-2,1,20), 
-                       cv=5, max_iter=5000, random_state=42)
+                       cv=5, max_iter=5000, random_state=42, n_jobs=-1)
     m_n.fit(X_n, y_n)
     r2_n = r2_score(y_n, m_n.predict(X_n))
     adj_r2_n = 1 - (1 - r2_n) * (len(y_n) - 1) / (len(y_n) - 6 - 1)
@@ -192,7 +240,7 @@ def main():
     
     X_nn = StandardScaler().fit_transform(nn_df[nn_feats])
     m_nn = ElasticNetCV(l1_ratio=[0.1,0.3,0.5,0.7,0.9], alphas=np.logspace(-2,1,20),
-                        cv=5, max_iter=5000, random_state=42)
+                        cv=5, max_iter=5000, random_state=42, n_jobs=-1)
     m_nn.fit(X_nn, y_nn)
     r2_nn = r2_score(y_nn, m_nn.predict(X_nn))
     adj_r2_nn = 1 - (1 - r2_nn) * (len(y_nn) - 1) / (len(y_nn) - 3 - 1)
@@ -9,10 +9,17 @@ This script demonstrates:
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from ost_writing import FeatureExtractor
 
 
+def read_text(path):
+    """Read a UTF-8 text file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
 def main():
     # Initialize extractor
     extractor = FeatureExtractor(prefix="OST_")
@@ -46,15 +53,11 @@ def main():
     sample_dir = os.path.join(os.path.dirname(__file__), "sample_data")
     
     if os.path.exists(sample_dir):
-        texts = []
-        filenames = []
+        filenames = [f for f in sorted(os.listdir(sample_dir)) if f.endswith(".txt")]
         
-        for filename in sorted(os.listdir(sample_dir)):
-            if filename.endswith(".txt"):
-                filepath = os.path.join(sample_dir, filename)
-                with open(filepath, "r", encoding="utf-8") as f:
-                    texts.append(f.read())
-                filenames.append(filename)
+        # File reads are I/O-bound, so threads overlap them despite the GIL
+        with ThreadPoolExecutor() as pool:
+            texts = list(pool.map(read_text, (os.path.join(sample_dir, f) for f in filenames)))
         
         if texts:
             df = extractor.extract_batch(texts, show_progress=True)
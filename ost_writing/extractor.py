@@ -5,20 +5,12 @@ Provides FeatureExtractor class for extracting all 20 linguistic
 features from text samples.
 """
 
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 import pandas as pd
-from tqdm import tqdm
 
 from .utils.nlp_setup import ensure_nltk_data, get_nlp
-from .features import (
-    word_count, avg_sentence_length, num_complex_sentences,
-    lexical_diversity, vocabulary_sophistication, polysemy_word,
-    sentence_type_diversity, syntactic_simplicity, information_density,
-    error_count, context_sensitive_count,
-    flesch_kincaid_grade_level, text_ease,
-    referential_cohesion, deep_cohesion,
-    word_length_variance, syllable_variance,
-    num_t_units, mean_length_t_unit, dependent_clauses_per_t_unit,
+from .features.batch import (
+    FEATURE_NAMES, _feature_cache, _text_key, extract_all, extract_features,
 )
 
 
@@ -42,26 +34,24 @@ class FeatureExtractor:
         >>> df = extractor.extract_batch(["Text 1", "Text 2"])
     """
     
-    FEATURE_NAMES = [
-        "word_count", "avg_sentence_length", "num_complex_sentences",
-        "lexical_diversity", "vocabulary_sophistication", "polysemy_word",
-        "sentence_type_diversity", "syntactic_simplicity", "information_density",
-        "error_count", "context_sensitive_count",
-        "flesch_kincaid_grade_level", "text_ease",
-        "referential_cohesion", "deep_cohesion",
-        "word_length_variance", "syllable_variance",
-        "num_t_units", "mean_length_t_unit", "dependent_clauses_per_t_unit",
-    ]
+    FEATURE_NAMES = FEATURE_NAMES
     
-    def __init__(self, prefix: str = "OST_"):
+    def __init__(self, prefix: str = "OST_", cache_dir: Optional[str] = None):
         """
         Initialize feature extractor.
         
         Args:
             prefix: Prefix for feature names in output (default: "OST_").
                     Set to "" for no prefix.
+            cache_dir: Directory for an on-disk feature cache keyed on a
+                    hash of each text (default: None, no caching). Reruns
+                    over unchanged texts skip parsing entirely. Keys include
+                    features.batch.FEATURE_VERSION, so results from older
+                    feature code are never served.
         """
         self.prefix = prefix
+        self.cache_dir = cache_dir
+        self._cached_features = _feature_cache(cache_dir)
         ensure_nltk_data()
         # Pre-load SpaCy model
         get_nlp()
@@ -77,30 +67,20 @@ class FeatureExtractor:
             Dictionary mapping feature names to values.
         """
         if not text or not isinstance(text, str):
-            return {f"{self.prefix}{name}": 0 for name in self.FEATURE_NAMES}
+            return self._empty_features()
         
-        features = {
-            "word_count": word_count(text),
-            "avg_sentence_length": avg_sentence_length(text),
-            "num_complex_sentences": num_complex_sentences(text),
-            "lexical_diversity": lexical_diversity(text),
-            "vocabulary_sophistication": vocabulary_sophistication(text),
-            "polysemy_word": polysemy_word(text),
-            "sentence_type_diversity": sentence_type_diversity(text),
-            "syntactic_simplicity": syntactic_simplicity(text),
-            "information_density": information_density(text),
-            "error_count": error_count(text),
-            "context_sensitive_count": context_sensitive_count(text),
-            "flesch_kincaid_grade_level": flesch_kincaid_grade_level(text),
-            "text_ease": text_ease(text),
-            "referential_cohesion": referential_cohesion(text),
-            "deep_cohesion": deep_cohesion(text),
-            "word_length_variance": word_length_variance(text),
-            "syllable_variance": syllable_variance(text),
-            "num_t_units": num_t_units(text),
-            "mean_length_t_unit": mean_length_t_unit(text),
-            "dependent_clauses_per_t_unit": dependent_clauses_per_t_unit(text),
-        }
+        return self._features(text)
+    
+    def _empty_features(self) -> Dict[str, Union[int, float]]:
+        """Zero-valued feature dict used for empty or non-string input."""
+        return {f"{self.prefix}{name}": 0 for name in self.FEATURE_NAMES}
+    
+    def _features(self, text: str, doc=None) -> Dict[str, Union[int, float]]:
+        """Compute (or load from cache) prefixed features for one text."""
+        if self._cached_features is not None:
+            features = self._cached_features(_text_key(text), text, doc)
+        else:
+            features = extract_features(text, doc)
         
         if self.prefix:
             features = {f"{self.prefix}{k}": v for k, v in features.items()}
@@ -110,21 +90,38 @@ class FeatureExtractor:
     def extract_batch(
         self, 
         texts: List[str], 
-        show_progress: bool = True
+        show_progress: bool = True,
+        batch_size: int = 64,
+        n_process: int = 1,
+        n_jobs: int = 1
     ) -> pd.DataFrame:
         """
         Extract features from multiple texts.
         
+        Texts are parsed in batches with SpaCy's nlp.pipe, so each text
+        is parsed exactly once and shared across all feature modules.
+        Texts already in the on-disk cache (see cache_dir) are not parsed.
+        Wraps features.batch.extract_all, adding the column prefix.
+        
         Args:
             texts: List of text strings.
             show_progress: Show progress bar (default: True).
+            batch_size: Number of texts SpaCy parses per batch (default: 64).
+            n_process: Number of SpaCy parsing processes (default: 1).
+            n_jobs: Number of worker processes for full feature extraction
+                    (default: 1). Each worker loads its own SpaCy model and
+                    LanguageTool server and handles batch_size texts at a
+                    time; -1 uses all cores.
             
         Returns:
             DataFrame with one row per text and columns for each feature.
         """
-        iterator = tqdm(texts, desc="Extracting features") if show_progress else texts
-        results = [self.extract(text) for text in iterator]
-        return pd.DataFrame(results)
+        df = extract_all(
+            texts, n_process, batch_size, n_jobs, self.cache_dir, show_progress
+        )
+        if self.prefix:
+            df = df.add_prefix(self.prefix)
+        return df
     
     def extract_from_dataframe(
         self,
@@ -146,3 +143,4 @@ class FeatureExtractor:
         texts = df[text_column].tolist()
         features_df = self.extract_batch(texts, show_progress)
         return pd.concat([df.reset_index(drop=True), features_df], axis=1)
+
@@ -10,6 +10,8 @@ Categories:
     - cohesion: Referential cohesion, deep cohesion
     - variability: Word length variance, syllable variance
     - clausal: T-unit metrics
+
+Corpus-level extraction of all features at once lives in batch.
 """
 
 from .surface import word_count, avg_sentence_length, num_complex_sentences
@@ -20,6 +22,7 @@ from .readability import flesch_kincaid_grade_level, text_ease
 from .cohesion import referential_cohesion, deep_cohesion
 from .variability import word_length_variance, syllable_variance
 from .clausal import num_t_units, mean_length_t_unit, dependent_clauses_per_t_unit
+from .batch import FEATURE_NAMES, extract_features, extract_all
 
 __all__ = [
     "word_count", "avg_sentence_length", "num_complex_sentences",
@@ -30,4 +33,5 @@ __all__ = [
     "referential_cohesion", "deep_cohesion",
     "word_length_variance", "syllable_variance",
     "num_t_units", "mean_length_t_unit", "dependent_clauses_per_t_unit",
+    "FEATURE_NAMES", "extract_features", "extract_all",
 ]
@@ -7,10 +7,14 @@ Features:
 """
 
 import re
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import wordnet
+from collections import Counter
+from typing import TYPE_CHECKING, Optional
 
 from ..utils.nlp_setup import get_nlp
+from ..utils.text_processing import primary_lemma
+
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
 
 # Lazy loading for language_tool_python
 _language_tool = None
@@ -50,7 +54,7 @@ def error_count(text: str) -> int:
     return len(matches)
 
 
-def context_sensitive_count(text: str) -> int:
+def context_sensitive_count(text: str, doc: Optional["Doc"] = None) -> int:
     """
     Count words where usage differs from primary WordNet sense.
     
@@ -59,22 +63,21 @@ def context_sensitive_count(text: str) -> int:
     
     Args:
         text: Input text string.
+        doc: Pre-parsed SpaCy Doc for text (parsed here if omitted).
         
     Returns:
         Count of context-sensitive word usages.
     """
-    nlp = get_nlp()
-    doc = nlp(text)
+    if doc is None:
+        doc = get_nlp()(text)
+    
+    # Query WordNet once per distinct word, weighted by its frequency
+    word_counts = Counter(token.lower_ for token in doc if token.is_alpha)
     
     count = 0
-    for token in doc:
-        if not token.is_alpha:
-            continue
-        
-        synsets = wordnet.synsets(token.text.lower())
-        if synsets:
-            primary_lemma = synsets[0].lemmas()[0].name().lower()
-            if primary_lemma != token.text.lower():
-                count += 1
+    for word, n in word_counts.items():
+        lemma = primary_lemma(word)
+        if lemma is not None and lemma != word:
+            count += n
     
     return count
@@ -0,0 +1,193 @@
+"""
+Corpus-level feature extraction.
+
+Computes all 20 features for many texts in a single pass: texts are
+parsed together with SpaCy's nlp.pipe, and each text's Doc and cached
+Tokens are shared by every feature function instead of being rebuilt
+per feature. Large corpora can be sharded across worker processes and
+results cached on disk.
+"""
+
+import hashlib
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+from joblib import Memory, Parallel, delayed
+from tqdm import tqdm
+
+from ..utils.nlp_setup import UNUSED_PIPES, get_nlp
+from ..utils.text_processing import get_tokens
+from .surface import word_count, avg_sentence_length, num_complex_sentences
+from .lexical import lexical_diversity, vocabulary_sophistication, polysemy_word
+from .syntactic import sentence_type_diversity, syntactic_simplicity, information_density
+from .accuracy import error_count, context_sensitive_count
+from .readability import flesch_kincaid_grade_level, text_ease
+from .cohesion import referential_cohesion, deep_cohesion
+from .variability import word_length_variance, syllable_variance
+from .clausal import (
+    _extract_t_units, num_t_units, mean_length_t_unit, dependent_clauses_per_t_unit,
+)
+
+FEATURE_NAMES = [
+    "word_count", "avg_sentence_length", "num_complex_sentences",
+    "lexical_diversity", "vocabulary_sophistication", "polysemy_word",
+    "sentence_type_diversity", "syntactic_simplicity", "information_density",
+    "error_count", "context_sensitive_count",
+    "flesch_kincaid_grade_level", "text_ease",
+    "referential_cohesion", "deep_cohesion",
+    "word_length_variance", "syllable_variance",
+    "num_t_units", "mean_length_t_unit", "dependent_clauses_per_t_unit",
+]
+
+# Part of every on-disk cache key; bump whenever a change to the feature
+# functions, tokenizers or models alters any feature value
+FEATURE_VERSION = 1
+
+
+def extract_features(text: str, doc=None) -> Dict[str, Union[int, float]]:
+    """
+    Compute all features for one text.
+    
+    Args:
+        text: Input text string.
+        doc: Pre-parsed SpaCy Doc for text (parsed here if omitted).
+    
+    Returns:
+        Dictionary mapping (unprefixed) feature names to values.
+    """
+    if doc is None:
+        doc = get_nlp()(text, disable=UNUSED_PIPES)
+    
+    # Tokenize once; every feature reads from the same Tokens
+    toks = get_tokens(text)
+    
+    # Shared by all three clausal features
+    t_units = _extract_t_units(text, doc)
+    
+    features = {
+        "word_count": word_count(text, toks),
+        "avg_sentence_length": avg_sentence_length(text, toks),
+        "num_complex_sentences": num_complex_sentences(text, toks=toks),
+        # Lexical features read lower_words/is_stop from the cached Tokens
+        "lexical_diversity": lexical_diversity(text),
+        "vocabulary_sophistication": vocabulary_sophistication(text),
+        "polysemy_word": polysemy_word(text),
+        "sentence_type_diversity": sentence_type_diversity(text, toks),
+        "syntactic_simplicity": syntactic_simplicity(text, toks),
+        "information_density": information_density(text, toks),
+        "error_count": error_count(text),
+        "context_sensitive_count": context_sensitive_count(text, doc),
+        "flesch_kincaid_grade_level": flesch_kincaid_grade_level(text, toks),
+        "text_ease": text_ease(text, toks),
+        "referential_cohesion": referential_cohesion(text, toks.sent_words),
+        "deep_cohesion": deep_cohesion(text, toks.alpha_words),
+        "word_length_variance": word_length_variance(text, toks),
+        "syllable_variance": syllable_variance(text, toks),
+        "num_t_units": num_t_units(text, t_units=t_units),
+        "mean_length_t_unit": mean_length_t_unit(text, t_units=t_units),
+        "dependent_clauses_per_t_unit": dependent_clauses_per_t_unit(
+            text, t_units=t_units
+        ),
+    }
+    
+    return features
+
+
+def _text_key(text: str) -> str:
+    """Hash of FEATURE_VERSION and text, used as the on-disk cache key."""
+    h = hashlib.blake2b(f"v{FEATURE_VERSION}\0".encode("utf-8"))
+    h.update(text.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _cached_compute_features(key: str, text: str, doc=None) -> Dict[str, Union[int, float]]:
+    """joblib.Memory target; results are keyed on key alone."""
+    return extract_features(text, doc)
+
+
+def _feature_cache(cache_dir: Optional[str]):
+    """
+    Build the on-disk feature cache for a directory.
+    
+    Args:
+        cache_dir: Cache directory, or None for no caching.
+    
+    Returns:
+        joblib.Memory-wrapped function called as (key, text, doc), or
+        None if cache_dir is None.
+    """
+    if cache_dir is None:
+        return None
+    memory = Memory(cache_dir, verbose=0)
+    return memory.cache(_cached_compute_features, ignore=["text", "doc"])
+
+
+def extract_all(
+    texts: List[str],
+    n_process: int = 1,
+    batch_size: int = 64,
+    n_jobs: int = 1,
+    cache_dir: Optional[str] = None,
+    show_progress: bool = False
+) -> pd.DataFrame:
+    """
+    Compute all features for a corpus with one nlp.pipe pass.
+    
+    Empty or non-string entries get all-zero features, matching
+    FeatureExtractor.
+    
+    Args:
+        texts: List of text strings.
+        n_process: Number of SpaCy parsing processes (default: 1).
+        batch_size: Number of texts SpaCy parses per batch (default: 64).
+        n_jobs: Number of worker processes (default: 1). Texts are sharded
+            into batch_size chunks and each worker loads its models once
+            for all chunks it runs; -1 uses all cores.
+        cache_dir: Directory for an on-disk feature cache keyed on a hash
+            of each text and FEATURE_VERSION (default: None, no caching).
+            Cached texts are not parsed.
+        show_progress: Show progress bar (default: False).
+    
+    Returns:
+        DataFrame with one row per text and one column per feature.
+    """
+    if n_jobs != 1 and len(texts) > batch_size:
+        chunks = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        frames = Parallel(n_jobs=n_jobs, backend="loky", return_as="generator")(
+            delayed(extract_all)(chunk, 1, batch_size, 1, cache_dir)
+            for chunk in chunks
+        )
+        if show_progress:
+            frames = tqdm(frames, total=len(chunks), desc="Extracting features")
+        return pd.concat(list(frames), ignore_index=True)
+    
+    cached = _feature_cache(cache_dir)
+    valid = [bool(text) and isinstance(text, str) for text in texts]
+    # Only parse texts whose features are not already cached on disk
+    if cached is not None:
+        keys = [_text_key(text) if ok else None for text, ok in zip(texts, valid)]
+        parse = [
+            ok and not cached.check_call_in_cache(key, text)
+            for text, ok, key in zip(texts, valid, keys)
+        ]
+    else:
+        parse = valid
+    docs = get_nlp().pipe(
+        (text for text, p in zip(texts, parse) if p),
+        batch_size=batch_size, n_process=n_process, disable=UNUSED_PIPES,
+    )
+    
+    empty = dict.fromkeys(FEATURE_NAMES, 0)
+    rows = []
+    iterator = enumerate(zip(texts, valid, parse))
+    if show_progress:
+        iterator = tqdm(iterator, total=len(texts), desc="Extracting features")
+    for i, (text, ok, p) in iterator:
+        doc = next(docs) if p else None
+        if not ok:
+            rows.append(empty)
+        elif cached is not None:
+            rows.append(cached(keys[i], text, doc))
+        else:
+            rows.append(extract_features(text, doc))
+    return pd.DataFrame(rows, columns=FEATURE_NAMES)
@@ -14,10 +14,15 @@ References:
     Lu, X. (2010). Automatic analysis of syntactic complexity in L2 writing.
 """
 
+from typing import TYPE_CHECKING, Optional
+
 from ..utils.nlp_setup import get_nlp
 
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
+
 
-def _extract_t_units(text: str) -> tuple:
+def _extract_t_units(text: str, doc: Optional["Doc"] = None) -> tuple:
     """
     Extract T-units and dependent clause count from text.
     
@@ -26,12 +31,13 @@ def _extract_t_units(text: str) -> tuple:
     
     Args:
         text: Input text string.
+        doc: Pre-parsed SpaCy Doc for text (parsed here if omitted).
         
     Returns:
         Tuple of (list of T-unit lengths, total dependent clause count).
     """
-    nlp = get_nlp()
-    doc = nlp(text)
+    if doc is None:
+        doc = get_nlp()(text)
     
     t_unit_lengths = []
     dep_clause_count = 0
@@ -66,21 +72,27 @@ def _extract_t_units(text: str) -> tuple:
     return t_unit_lengths, dep_clause_count
 
 
-def num_t_units(text: str) -> int:
+def num_t_units(
+    text: str, doc: Optional["Doc"] = None, t_units: Optional[tuple] = None
+) -> int:
     """
     Count T-units (minimal terminable units) in text.
     
     Args:
         text: Input text string.
+        doc: Pre-parsed SpaCy Doc for text (optional).
+        t_units: Precomputed result of _extract_t_units (optional).
         
     Returns:
         Number of T-units.
     """
-    t_unit_lengths, _ = _extract_t_units(text)
+    t_unit_lengths, _ = t_units or _extract_t_units(text, doc)
     return len(t_unit_lengths)
 
 
-def mean_length_t_unit(text: str) -> float:
+def mean_length_t_unit(
+    text: str, doc: Optional["Doc"] = None, t_units: Optional[tuple] = None
+) -> float:
     """
     Calculate mean length of T-unit (MLT).
     
@@ -89,6 +101,8 @@ def mean_length_t_unit(text: str) -> float:
     
     Args:
         text: Input text string.
+        doc: Pre-parsed SpaCy Doc for text (optional).
+        t_units: Precomputed result of _extract_t_units (optional).
         
     Returns:
         Average words per T-unit. Returns 0.0 if no T-units found.
@@ -96,7 +110,7 @@ def mean_length_t_unit(text: str) -> float:
     References:
         Lu, X. (2010). Automatic analysis of syntactic complexity.
     """
-    t_unit_lengths, _ = _extract_t_units(text)
+    t_unit_lengths, _ = t_units or _extract_t_units(text, doc)
     
     if not t_unit_lengths:
         return 0.0
@@ -104,7 +118,9 @@ def mean_length_t_unit(text: str) -> float:
     return sum(t_unit_lengths) / len(t_unit_lengths)
 
 
-def dependent_clauses_per_t_unit(text: str) -> float:
+def dependent_clauses_per_t_unit(
+    text: str, doc: Optional["Doc"] = None, t_units: Optional[tuple] = None
+) -> float:
     """
     Calculate dependent clause ratio (DC/T).
     
@@ -113,11 +129,13 @@ def dependent_clauses_per_t_unit(text: str) -> float:
     
     Args:
         text: Input text string.
+        doc: Pre-parsed SpaCy Doc for text (optional).
+        t_units: Precomputed result of _extract_t_units (optional).
         
     Returns:
         Dependent clauses per T-unit ratio.
     """
-    t_unit_lengths, dep_count = _extract_t_units(text)
+    t_unit_lengths, dep_count = t_units or _extract_t_units(text, doc)
     
     if not t_unit_lengths:
         return 0.0
@@ -6,12 +6,36 @@ Features:
     - deep_cohesion: Logical connective density
 """
 
-from nltk.tokenize import word_tokenize, sent_tokenize
+import re
+from typing import List, Optional
+
+import numpy as np
+from scipy import sparse
 
 from ..utils.nlp_setup import get_stopwords
+from ..utils.text_processing import get_tokens
+
+_CONNECTIVES = (
+    # Causal
+    "because", "therefore", "thus", "consequently", "so",
+    # Contrastive
+    "although", "though", "however", "but", "despite",
+    # Temporal
+    "first", "second", "next", "then", "finally", "last",
+    # Additive
+    "furthermore", "moreover", "additionally", "also",
+)
 
+# Space-delimited connectives, matched in a single pass over the text.
+# Counts match the per-connective str.count(" c "): that consumes the
+# trailing space, so an immediate repeat ("so so") is taken in the same
+# match and counts once
+_CONN_RE = re.compile(r"(?<= )(%s)(?= )(?: \1(?= ))?" % "|".join(_CONNECTIVES))
 
-def referential_cohesion(text: str) -> float:
+
+def referential_cohesion(
+    text: str, sentence_tokens: Optional[List[List[str]]] = None
+) -> float:
     """
     Measure content word overlap between adjacent sentences.
     
@@ -20,6 +44,8 @@ def referential_cohesion(text: str) -> float:
     
     Args:
         text: Input text string.
+        sentence_tokens: Pre-computed word tokens for each sentence of
+            text (optional).
         
     Returns:
         Mean overlap score across sentence pairs (0-1 scale).
@@ -28,32 +54,42 @@ def referential_cohesion(text: str) -> float:
         McNamara, D. S., et al. (2014). Automated evaluation of text
         and discourse with Coh-Metrix.
     """
-    sentences = sent_tokenize(text)
-    if len(sentences) <= 1:
+    if sentence_tokens is None:
+        sentence_tokens = get_tokens(text).sent_words
+    if len(sentence_tokens) <= 1:
         return 0.0
     
     stop_words = get_stopwords()
-    overlaps = []
     
-    for i in range(len(sentences) - 1):
-        tokens1 = {t.lower() for t in word_tokenize(sentences[i]) 
-                   if t.isalpha() and t.lower() not in stop_words}
-        tokens2 = {t.lower() for t in word_tokenize(sentences[i + 1]) 
-                   if t.isalpha() and t.lower() not in stop_words}
-        
-        if not tokens1 or not tokens2:
-            continue
-        
-        intersection = len(tokens1 & tokens2)
-        union = len(tokens1 | tokens2)
-        
-        if union > 0:
-            overlaps.append(intersection / union)
+    # Binary sentence x content-word membership matrix
+    vocab = {}
+    rows, cols = [], []
+    for i, tokens in enumerate(sentence_tokens):
+        for word in set(map(str.lower, filter(str.isalpha, tokens))) - stop_words:
+            rows.append(i)
+            cols.append(vocab.setdefault(word, len(vocab)))
     
-    return sum(overlaps) / len(overlaps) if overlaps else 0.0
+    if not vocab:
+        return 0.0
+    
+    M = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(len(sentence_tokens), len(vocab)),
+    )
+    
+    # Jaccard for every adjacent pair at once; skip pairs with an empty side
+    sizes = np.diff(M.indptr)
+    intersection = np.asarray(M[:-1].multiply(M[1:]).sum(axis=1)).ravel()
+    union = sizes[:-1] + sizes[1:] - intersection
+    valid = (sizes[:-1] > 0) & (sizes[1:] > 0)
+    
+    if not valid.any():
+        return 0.0
+    
+    return float((intersection[valid] / union[valid]).mean())
 
 
-def deep_cohesion(text: str) -> float:
+def deep_cohesion(text: str, tokens: Optional[List[str]] = None) -> float:
     """
     Measure logical connective density.
     
@@ -63,6 +99,7 @@ def deep_cohesion(text: str) -> float:
     
     Args:
         text: Input text string.
+        tokens: Pre-computed word tokens of text (optional).
         
     Returns:
         Connective density (connectives per word).
@@ -70,22 +107,13 @@ def deep_cohesion(text: str) -> float:
     References:
         Halliday, M. A. K., & Hasan, R. (1976). Cohesion in English.
     """
-    connectives = [
-        # Causal
-        "because", "therefore", "thus", "consequently", "so",
-        # Contrastive
-        "although", "though", "however", "but", "despite",
-        # Temporal
-        "first", "second", "next", "then", "finally", "last",
-        # Additive
-        "furthermore", "moreover", "additionally", "also",
-    ]
-    
     text_lower = text.lower()
-    words = [t for t in word_tokenize(text) if t.isalpha()]
+    if tokens is None:
+        tokens = get_tokens(text).alpha_words
+    words = list(filter(str.isalpha, tokens))
     
     if not words:
         return 0.0
     
-    conn_count = sum(text_lower.count(f" {c} ") for c in connectives)
+    conn_count = len(_CONN_RE.findall(text_lower))
     return conn_count / len(words)
@@ -7,13 +7,29 @@ Features:
     - polysemy_word: Count of polysemous words
 """
 
-from nltk.tokenize import word_tokenize
-from nltk.corpus import wordnet
+from itertools import compress
+from typing import List, Optional
 
 from ..utils.nlp_setup import get_stopwords
+from ..utils.text_processing import avg_min_depth, get_synsets, get_tokens
 
 
-def lexical_diversity(text: str) -> float:
+def _content_words(text: str, tokens: Optional[List[str]]) -> List[str]:
+    """
+    Lowercased alphabetic non-stopwords of text.
+    
+    Without tokens, reads the interned lower_words and is_stop mask from
+    get_tokens instead of testing each word against the stopword set.
+    """
+    if tokens is None:
+        toks = get_tokens(text)
+        return list(compress(toks.lower_words, ~toks.is_stop))
+    stop_words = get_stopwords()
+    return [t for t in map(str.lower, filter(str.isalpha, tokens))
+            if t not in stop_words]
+
+
+def lexical_diversity(text: str, tokens: Optional[List[str]] = None) -> float:
     """
     Calculate Type-Token Ratio (TTR).
     
@@ -21,6 +37,7 @@ def lexical_diversity(text: str) -> float:
     
     Args:
         text: Input text string.
+        tokens: Pre-computed word tokens of text (optional).
         
     Returns:
         TTR value between 0 and 1. Returns 0.0 if no tokens.
@@ -28,13 +45,16 @@ def lexical_diversity(text: str) -> float:
     References:
         Templin, M. C. (1957). Certain language skills in children.
     """
-    tokens = [t.lower() for t in word_tokenize(text) if t.isalpha()]
+    if tokens is None:
+        tokens = get_tokens(text).lower_words
+    else:
+        tokens = list(map(str.lower, filter(str.isalpha, tokens)))
     if not tokens:
         return 0.0
     return len(set(tokens)) / len(tokens)
 
 
-def vocabulary_sophistication(text: str) -> float:
+def vocabulary_sophistication(text: str, tokens: Optional[List[str]] = None) -> float:
     """
     Measure vocabulary sophistication using WordNet synset depth.
     
@@ -43,6 +63,7 @@ def vocabulary_sophistication(text: str) -> float:
     
     Args:
         text: Input text string.
+        tokens: Pre-computed word tokens of text (optional).
         
     Returns:
         Sophistication score (0-1 scale).
@@ -50,19 +71,12 @@ def vocabulary_sophistication(text: str) -> float:
     References:
         Miller, G. A. (1995). WordNet: A lexical database for English.
     """
-    stop_words = get_stopwords()
-    tokens = [t.lower() for t in word_tokenize(text) 
-              if t.isalpha() and t.lower() not in stop_words]
+    tokens = _content_words(text, tokens)
     
     if not tokens:
         return 0.0
     
-    depths = []
-    for token in tokens:
-        synsets = wordnet.synsets(token)
-        if synsets:
-            token_depths = [s.min_depth() for s in synsets]
-            depths.append(sum(token_depths) / len(token_depths))
+    depths = [d for d in map(avg_min_depth, tokens) if d is not None]
     
     if not depths:
         return 0.0
@@ -71,7 +85,7 @@ def vocabulary_sophistication(text: str) -> float:
     return min(1.0, avg_depth / 10.0)
 
 
-def polysemy_word(text: str) -> int:
+def polysemy_word(text: str, tokens: Optional[List[str]] = None) -> int:
     """
     Count words with multiple WordNet senses.
     
@@ -80,18 +94,11 @@ def polysemy_word(text: str) -> int:
     
     Args:
         text: Input text string.
+        tokens: Pre-computed word tokens of text (optional).
         
     Returns:
         Count of polysemous words.
     """
-    stop_words = get_stopwords()
-    tokens = [t.lower() for t in word_tokenize(text) 
-              if t.isalpha() and t.lower() not in stop_words]
-    
-    count = 0
-    for token in tokens:
-        synsets = wordnet.synsets(token)
-        if len(synsets) > 1:
-            count += 1
+    tokens = _content_words(text, tokens)
     
-    return count
+    return sum(1 for token in tokens if len(get_synsets(token)) > 1)
@@ -6,12 +6,16 @@ Features:
     - text_ease: Composite text easability score (Coh-Metrix analog)
 """
 
-from nltk.tokenize import word_tokenize, sent_tokenize
+from typing import Optional
 
-from ..utils.text_processing import count_syllables
+from ..utils.text_processing import Tokens, get_tokens
 
+# text_ease weights: grade ease, syntactic simplicity, word concreteness,
+# referential cohesion, deep cohesion
+_WEIGHTS = (0.25, 0.25, 0.20, 0.15, 0.15)
 
-def flesch_kincaid_grade_level(text: str) -> float:
+
+def flesch_kincaid_grade_level(text: str, toks: Optional[Tokens] = None) -> float:
     """
     Calculate Flesch-Kincaid Grade Level.
     
@@ -19,6 +23,7 @@ def flesch_kincaid_grade_level(text: str) -> float:
     
     Args:
         text: Input text string.
+        toks: Pre-computed get_tokens(text) result (optional).
         
     Returns:
         Estimated U.S. grade level required to comprehend the text.
@@ -26,15 +31,14 @@ def flesch_kincaid_grade_level(text: str) -> float:
     References:
         Kincaid, J. P., et al. (1975). Derivation of new readability formulas.
     """
-    sentences = sent_tokenize(text)
-    words = [t for t in word_tokenize(text) if t.isalpha()]
+    toks = toks or get_tokens(text)
     
-    if not sentences or not words:
+    if not toks.sentences or not toks.alpha_words:
         return 0.0
     
-    word_count = len(words)
-    sentence_count = len(sentences)
-    syllable_count = sum(count_syllables(w) for w in words)
+    word_count = len(toks.alpha_words)
+    sentence_count = len(toks.sentences)
+    syllable_count = int(toks.syllable_counts.sum())
     
     grade = (0.39 * (word_count / sentence_count) + 
              11.8 * (syllable_count / word_count) - 15.59)
@@ -42,7 +46,7 @@ def flesch_kincaid_grade_level(text: str) -> float:
     return max(0.0, grade)
 
 
-def text_ease(text: str) -> float:
+def text_ease(text: str, toks: Optional[Tokens] = None) -> float:
     """
     Calculate composite text easability score.
     
@@ -58,6 +62,7 @@ def text_ease(text: str) -> float:
     
     Args:
         text: Input text string.
+        toks: Pre-computed get_tokens(text) result (optional).
         
     Returns:
         Text ease score (0-1 scale).
@@ -69,20 +74,22 @@ def text_ease(text: str) -> float:
     from .syntactic import syntactic_simplicity
     from .cohesion import referential_cohesion, deep_cohesion
     
+    # Tokenize once and share with every component
+    toks = toks or get_tokens(text)
+    
     # Grade level component (inverted: lower grade = easier)
-    fk_grade = flesch_kincaid_grade_level(text)
-    grade_ease = 1.0 - min(1.0, max(0.0, (fk_grade - 3) / 15.0))
+    fk_grade = flesch_kincaid_grade_level(text, toks)
+    grade_ease = max(0.0, min(1.0, 1.0 - (fk_grade - 3) / 15.0))
     
     # Get component scores
-    synt_simp = syntactic_simplicity(text)
-    ref_coh = referential_cohesion(text)
-    deep_coh = deep_cohesion(text)
+    synt_simp = syntactic_simplicity(text, toks)
+    ref_coh = referential_cohesion(text, toks.sent_words)
+    deep_coh = deep_cohesion(text, toks.alpha_words)
     
     # Word concreteness placeholder (simplified)
     word_concrete = 0.5  # Neutral default
     
-    # Weighted combination
-    weights = [0.25, 0.25, 0.20, 0.15, 0.15]
-    components = [grade_ease, synt_simp, word_concrete, ref_coh, deep_coh]
-    
-    return sum(w * c for w, c in zip(weights, components))
+    # Weighted combination, written out to avoid building intermediate lists
+    w_grade, w_synt, w_concrete, w_ref, w_deep = _WEIGHTS
+    return (w_grade * grade_ease + w_synt * synt_simp + w_concrete * word_concrete
+            + w_ref * ref_coh + w_deep * deep_coh)
@@ -7,42 +7,47 @@ Features:
     - num_complex_sentences: Sentences exceeding threshold length
 """
 
-from nltk.tokenize import word_tokenize, sent_tokenize
+from typing import Optional
 
+from ..utils.text_processing import Tokens, get_tokens
 
-def word_count(text: str) -> int:
+
+def word_count(text: str, toks: Optional[Tokens] = None) -> int:
     """
     Count total words (alphabetic tokens only).
     
     Args:
         text: Input text string.
+        toks: Pre-computed get_tokens(text) result (optional).
         
     Returns:
         Number of alphabetic words.
     """
-    tokens = word_tokenize(text)
-    return len([t for t in tokens if t.isalpha()])
+    toks = toks or get_tokens(text)
+    return int(toks.word_lengths.size)
 
 
-def avg_sentence_length(text: str) -> float:
+def avg_sentence_length(text: str, toks: Optional[Tokens] = None) -> float:
     """
     Calculate mean sentence length in words.
     
     Args:
         text: Input text string.
+        toks: Pre-computed get_tokens(text) result (optional).
         
     Returns:
         Average words per sentence. Returns 0.0 if no sentences found.
     """
-    sentences = sent_tokenize(text)
-    if not sentences:
+    toks = toks or get_tokens(text)
+    if not toks.simple_sentences:
         return 0.0
     
-    lengths = [len([t for t in word_tokenize(s) if t.isalpha()]) for s in sentences]
-    return sum(lengths) / len(lengths)
+    return float(toks.simple_sent_word_counts.mean())
 
 
-def num_complex_sentences(text: str, threshold: int = 15) -> int:
+def num_complex_sentences(
+    text: str, threshold: int = 15, toks: Optional[Tokens] = None
+) -> int:
     """
     Count sentences exceeding word count threshold.
     
@@ -52,6 +57,7 @@ def num_complex_sentences(text: str, threshold: int = 15) -> int:
     Args:
         text: Input text string.
         threshold: Minimum word count for complex classification (default: 15).
+        toks: Pre-computed get_tokens(text) result (optional).
         
     Returns:
         Number of complex sentences.
@@ -59,10 +65,5 @@ def num_complex_sentences(text: str, threshold: int = 15) -> int:
     References:
         Hunt, K. W. (1965). Grammatical structures written at three grade levels.
     """
-    sentences = sent_tokenize(text)
-    count = 0
-    for sent in sentences:
-        words = [t for t in word_tokenize(sent) if t.isalpha()]
-        if len(words) > threshold:
-            count += 1
-    return count
+    toks = toks or get_tokens(text)
+    return int((toks.simple_sent_word_counts > threshold).sum())
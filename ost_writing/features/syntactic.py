@@ -7,12 +7,18 @@ Features:
     - information_density: Content word ratio
 """
 
-from nltk.tokenize import word_tokenize, sent_tokenize
+from typing import Optional
 
-from ..utils.nlp_setup import get_stopwords
+from ..utils.text_processing import Tokens, get_tokens
 
+# Subordinators that open a complex sentence; the trailing space keeps
+# e.g. "sincerely" or "aftermath" from matching
+_COMPLEX_STARTERS = ("if ", "when ", "although ", "because ", "while ",
+                     "since ", "after ", "before ")
+_STARTER_LEN = max(len(w) for w in _COMPLEX_STARTERS)
 
-def sentence_type_diversity(text: str) -> float:
+
+def sentence_type_diversity(text: str, toks: Optional[Tokens] = None) -> float:
     """
     Measure variety in sentence constructions.
     
@@ -21,34 +27,38 @@ def sentence_type_diversity(text: str) -> float:
     
     Args:
         text: Input text string.
+        toks: Pre-computed get_tokens(text) result (optional).
         
     Returns:
         Diversity score (0-1 scale based on 5 possible types).
     """
-    sentences = sent_tokenize(text)
-    if not sentences:
+    toks = toks or get_tokens(text)
+    if not toks.simple_sentences:
         return 0.0
     
     types = set()
-    complex_starters = ("if", "when", "although", "because", "while", "since", "after", "before")
     
-    for sent in sentences:
+    for sent, words in zip(toks.simple_sentences, toks.simple_sent_words):
         sent_stripped = sent.strip()
         if sent_stripped.endswith("?"):
             types.add("question")
         elif sent_stripped.endswith("!"):
             types.add("exclamation")
-        elif any(sent_stripped.lower().startswith(w) for w in complex_starters):
+        elif sent_stripped[:_STARTER_LEN].lower().startswith(_COMPLEX_STARTERS):
             types.add("complex")
-        elif "," in sent and len(word_tokenize(sent)) > 10:
+        elif "," in sent and len(words) > 10:
             types.add("compound")
         else:
             types.add("simple")
+        
+        # All five types seen; later sentences cannot change the score
+        if len(types) == 5:
+            break
     
     return len(types) / 5.0
 
 
-def syntactic_simplicity(text: str) -> float:
+def syntactic_simplicity(text: str, toks: Optional[Tokens] = None) -> float:
     """
     Estimate syntactic simplicity based on sentence length.
     
@@ -57,6 +67,7 @@ def syntactic_simplicity(text: str) -> float:
     
     Args:
         text: Input text string.
+        toks: Pre-computed get_tokens(text) result (optional).
         
     Returns:
         Simplicity score (0-1 scale). Higher = simpler syntax.
@@ -64,18 +75,18 @@ def syntactic_simplicity(text: str) -> float:
     References:
         Graesser, A. C., et al. (2004). Coh-Metrix. Behavior Research Methods.
     """
-    sentences = sent_tokenize(text)
-    if not sentences:
+    toks = toks or get_tokens(text)
+    if not toks.simple_sentences:
         return 0.0
     
-    lengths = [len(word_tokenize(s)) for s in sentences]
+    lengths = [len(words) for words in toks.simple_sent_words]
     avg_len = sum(lengths) / len(lengths)
     
     # Transform: shorter sentences = higher simplicity
     return 1.0 / (1.0 + avg_len / 15.0) if avg_len > 0 else 0.0
 
 
-def information_density(text: str) -> float:
+def information_density(text: str, toks: Optional[Tokens] = None) -> float:
     """
     Calculate ratio of content words to total words.
     
@@ -84,15 +95,14 @@ def information_density(text: str) -> float:
     
     Args:
         text: Input text string.
+        toks: Pre-computed get_tokens(text) result (optional).
         
     Returns:
         Density ratio (0-1 scale).
     """
-    stop_words = get_stopwords()
-    tokens = [t.lower() for t in word_tokenize(text) if t.isalpha()]
+    is_stop = (toks or get_tokens(text)).is_stop
     
-    if not tokens:
+    if not is_stop.size:
         return 0.0
     
-    content_words = [t for t in tokens if t not in stop_words]
-    return len(content_words) / len(tokens)
+    return float((~is_stop).mean())
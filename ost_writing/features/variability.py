@@ -6,13 +6,12 @@ Features:
     - syllable_variance: Variance in syllable counts
 """
 
-import numpy as np
-from nltk.tokenize import word_tokenize
+from typing import Optional
 
-from ..utils.text_processing import count_syllables
+from ..utils.text_processing import Tokens, get_tokens
 
 
-def word_length_variance(text: str) -> float:
+def word_length_variance(text: str, toks: Optional[Tokens] = None) -> float:
     """
     Calculate variance in word lengths (characters).
     
@@ -21,6 +20,7 @@ def word_length_variance(text: str) -> float:
     
     Args:
         text: Input text string.
+        toks: Pre-computed get_tokens(text) result (optional).
         
     Returns:
         Variance of word lengths.
@@ -29,16 +29,15 @@ def word_length_variance(text: str) -> float:
         McNamara, D. S., et al. (2014). Automated evaluation of text
         and discourse with Coh-Metrix.
     """
-    words = [t for t in word_tokenize(text) if t.isalpha()]
+    lengths = (toks or get_tokens(text)).word_lengths
     
-    if not words:
+    if not lengths.size:
         return 0.0
     
-    lengths = [len(w) for w in words]
-    return float(np.var(lengths))
+    return float(lengths.var())
 
 
-def syllable_variance(text: str) -> float:
+def syllable_variance(text: str, toks: Optional[Tokens] = None) -> float:
     """
     Calculate variance in syllable counts per word.
     
@@ -46,14 +45,14 @@ def syllable_variance(text: str) -> float:
     
     Args:
         text: Input text string.
+        toks: Pre-computed get_tokens(text) result (optional).
         
     Returns:
         Variance of syllable counts.
     """
-    words = [t for t in word_tokenize(text) if t.isalpha()]
+    syllables = (toks or get_tokens(text)).syllable_counts
     
-    if not words:
+    if not syllables.size:
         return 0.0
     
-    syllables = [count_syllables(w) for w in words]
-    return float(np.var(syllables))
+    return float(syllables.var())
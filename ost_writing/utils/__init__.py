@@ -1,6 +1,9 @@
 """Utility functions for NLP setup and text processing."""
 
 from .nlp_setup import get_nlp, get_stopwords
-from .text_processing import count_syllables
+from .text_processing import count_syllables, count_syllables_batch, get_tokens, Tokens
 
-__all__ = ["get_nlp", "get_stopwords", "count_syllables"]
+__all__ = [
+    "get_nlp", "get_stopwords", "count_syllables", "count_syllables_batch",
+    "get_tokens", "Tokens",
+]
@@ -5,11 +5,30 @@ This module handles lazy loading of SpaCy models and NLTK resources
 to avoid repeated initialization overhead.
 """
 
+import os
+import sys
+from typing import Iterable
+
 import nltk
+import numpy as np
 from nltk.corpus import stopwords
 
 _nlp = None
+_punkt = None
 _stopwords = None
+_CHECKED = False
+
+# NLTK data packages and the data subdirectory each is installed under
+_NLTK_PACKAGES = [
+    ("punkt", "tokenizers"),
+    ("punkt_tab", "tokenizers"),
+    ("averaged_perceptron_tagger", "taggers"),
+    ("wordnet", "corpora"),
+    ("stopwords", "corpora"),
+]
+
+# SpaCy components no feature reads; disable them when parsing
+UNUSED_PIPES = ["ner", "lemmatizer"]
 
 
 def get_nlp():
@@ -32,28 +51,78 @@ def get_nlp():
     return _nlp
 
 
+def get_punkt():
+    """
+    Load the NLTK English Punkt sentence tokenizer (lazy initialization).
+    
+    Calling tokenize() on the shared instance skips the per-call model
+    lookup done by nltk.sent_tokenize.
+    
+    Returns:
+        Punkt tokenizer with a tokenize(text) method.
+    """
+    global _punkt
+    if _punkt is None:
+        ensure_nltk_data()
+        try:
+            from nltk.tokenize import PunktTokenizer
+            _punkt = PunktTokenizer("english")
+        except ImportError:
+            # NLTK < 3.8.2 ships Punkt only as a pickle
+            _punkt = nltk.data.load("tokenizers/punkt/english.pickle")
+    return _punkt
+
+
 def get_stopwords():
     """
     Load NLTK English stopwords (lazy initialization).
     
+    Words are interned so lookups of interned tokens short-circuit on
+    identity.
+    
     Returns:
-        set: Set of English stopwords.
+        frozenset: Immutable set of English stopwords.
     """
     global _stopwords
     if _stopwords is None:
-        try:
-            _stopwords = set(stopwords.words("english"))
-        except LookupError:
-            nltk.download("stopwords", quiet=True)
-            _stopwords = set(stopwords.words("english"))
+        ensure_nltk_data()
+        _stopwords = frozenset(sys.intern(w) for w in stopwords.words("english"))
     return _stopwords
 
 
+def stopword_mask(words: Iterable[str], count: int = -1) -> np.ndarray:
+    """
+    Flag stopwords in a token sequence as a boolean array.
+    
+    Tokens must already be lowercased.
+    
+    Args:
+        words: Lowercased tokens.
+        count: Number of tokens, if known (speeds up allocation).
+        
+    Returns:
+        Boolean array, True where the token is a stopword.
+    """
+    stop_words = get_stopwords()
+    return np.fromiter((w in stop_words for w in words), dtype=bool, count=count)
+
+
 def ensure_nltk_data():
-    """Download required NLTK data packages if not present."""
-    packages = ["punkt", "averaged_perceptron_tagger", "wordnet", "stopwords"]
-    for pkg in packages:
-        try:
-            nltk.data.find(f"tokenizers/{pkg}" if pkg == "punkt" else f"corpora/{pkg}" if pkg in ["wordnet", "stopwords"] else f"taggers/{pkg}")
-        except LookupError:
+    """
+    Download required NLTK data packages if not present.
+    
+    Checks each NLTK data directory for the package (unpacked or as a
+    .zip) with plain filesystem calls, and runs only once per process.
+    """
+    global _CHECKED
+    if _CHECKED:
+        return
+    for pkg, sub in _NLTK_PACKAGES:
+        installed = any(
+            os.path.isdir(os.path.join(root, sub, pkg))
+            or os.path.isfile(os.path.join(root, sub, pkg + ".zip"))
+            for root in nltk.data.path
+        )
+        if not installed:
             nltk.download(pkg, quiet=True)
+    _CHECKED = True
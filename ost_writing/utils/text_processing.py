@@ -4,6 +4,58 @@ Text processing utilities.
 Common functions shared across feature extraction modules.
 """
 
+import re
+import sys
+from functools import lru_cache
+from itertools import chain
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from nltk.corpus import wordnet
+
+from .nlp_setup import get_punkt, stopword_mask
+
+# Word/number runs and individual punctuation marks
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+# Whitespace following terminal punctuation
+_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def fast_tokens(text: str) -> List[str]:
+    """
+    Split text into word and punctuation tokens with a compiled regex.
+    
+    Replaces word_tokenize. Contractions and hyphenated compounds split
+    into their word runs and punctuation marks.
+    
+    Args:
+        text: Input text string.
+        
+    Returns:
+        List of tokens, in order.
+    """
+    return _TOKEN_RE.findall(text)
+
+
+def simple_sent_split(text: str) -> List[str]:
+    """
+    Split text into sentences at whitespace following '.', '!' or '?'.
+    
+    A cheap approximation of Punkt for features that only need coarse
+    sentence counts and lengths: abbreviations such as "Dr." end a
+    sentence here.
+    
+    Args:
+        text: Input text string.
+        
+    Returns:
+        List of sentence strings (empty for blank text).
+    """
+    text = text.strip()
+    if not text:
+        return []
+    return _SPLIT_RE.split(text)
+
 
 def count_syllables(word: str) -> int:
     """
@@ -24,18 +76,196 @@ def count_syllables(word: str) -> int:
     if len(word) <= 3:
         return 1
     
-    vowels = "aeiouy"
     count = 0
     prev_vowel = False
     
+    # Count vowel-group starts; testing against a literal keeps the loop
+    # body to one membership check and one branch per character
     for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not prev_vowel:
-            count += 1
-        prev_vowel = is_vowel
+        if char in "aeiouy":
+            if not prev_vowel:
+                count += 1
+            prev_vowel = True
+        else:
+            prev_vowel = False
     
     # Adjust for silent 'e'
-    if word.endswith("e") and count > 1:
+    if count > 1 and word[-1] == "e":
         count -= 1
     
-    return max(1, count)
+    return count or 1
+
+
+_VOWEL_LUT = np.zeros(128, dtype=bool)
+_VOWEL_LUT[np.frombuffer(b"aeiouy", dtype=np.uint8)] = True
+
+
+def count_syllables_batch(words) -> np.ndarray:
+    """
+    Vectorized count_syllables over a sequence of words.
+    
+    Words are joined into one code-point buffer so vowel-group starts,
+    word lengths, and the silent-'e' adjustment are computed with NumPy
+    array operations instead of a per-character Python loop. Results
+    match count_syllables word for word.
+    
+    Args:
+        words: Sequence of word strings (without NUL characters).
+        
+    Returns:
+        int32 array of syllable counts, one per word.
+    """
+    if not len(words):
+        return np.zeros(0, dtype=np.int32)
+    
+    joined = "\x00".join(w.strip() for w in words).lower()
+    chars = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+    is_vowel = (chars < 128) & _VOWEL_LUT[np.minimum(chars, 127)]
+    
+    # A syllable starts at each vowel not preceded by a vowel; the NUL
+    # separators are non-vowels, so groups never span two words
+    starts = is_vowel.copy()
+    starts[1:] &= ~is_vowel[:-1]
+    cum = np.concatenate(([0], np.cumsum(starts, dtype=np.int32)))
+    
+    seps = np.flatnonzero(chars == 0)
+    begin = np.concatenate(([0], seps + 1))
+    end = np.concatenate((seps, [len(chars)]))
+    lengths = end - begin
+    counts = cum[end] - cum[begin]
+    
+    # Silent 'e'
+    ends_e = (lengths > 0) & (chars[np.maximum(end - 1, 0)] == ord("e"))
+    counts -= ends_e & (counts > 1)
+    
+    counts = np.maximum(counts, 1)
+    counts[lengths <= 3] = 1
+    return counts.astype(np.int32)
+
+
+class Tokens(NamedTuple):
+    """
+    Tokenization of one text, shared by all feature functions.
+    
+    Attributes:
+        sentences: Punkt sentences.
+        sent_words: Word and punctuation tokens of each sentence.
+        alpha_words: Alphabetic tokens of the whole text, in order.
+        lower_words: Lowercased, interned entries of alpha_words.
+        simple_sentences: simple_sent_split sentences.
+        simple_sent_words: Word and punctuation tokens of each simple sentence.
+        simple_sent_word_counts: Number of alphabetic tokens in each
+            simple sentence.
+        word_lengths: Character length of each entry in alpha_words.
+        syllable_counts: Syllable count of each entry in alpha_words.
+        is_stop: Whether each entry in alpha_words is a stopword.
+    """
+    
+    sentences: Tuple[str, ...]
+    sent_words: Tuple[Tuple[str, ...], ...]
+    alpha_words: Tuple[str, ...]
+    lower_words: Tuple[str, ...]
+    simple_sentences: Tuple[str, ...]
+    simple_sent_words: Tuple[Tuple[str, ...], ...]
+    simple_sent_word_counts: np.ndarray
+    word_lengths: np.ndarray
+    syllable_counts: np.ndarray
+    is_stop: np.ndarray
+
+
+@lru_cache(maxsize=1024)
+def get_tokens(text: str) -> Tokens:
+    """
+    Tokenize a text once and cache the result (per process).
+    
+    Every feature function reads its sentences and words from here, so
+    Punkt runs once per text rather than once per feature; words come
+    from the regex tokenizers above. Per-word properties are stored as
+    parallel arrays so features reduce over them with NumPy. Coarse
+    sentence-length features use the simple_* fields from
+    simple_sent_split instead of Punkt. The returned arrays are read-only
+    because the result is shared between callers.
+    
+    Args:
+        text: Input text string.
+        
+    Returns:
+        Tokens for the text.
+    """
+    sentences = tuple(get_punkt().tokenize(text))
+    sent_words = tuple(tuple(fast_tokens(s)) for s in sentences)
+    # Alphabetic words are filtered from the existing tokens (a C-level
+    # loop) rather than found by a second regex pass over each sentence
+    alpha_words = tuple(filter(str.isalpha, chain.from_iterable(sent_words)))
+    # Interned so set lookups hit the identity check and reuse the cached
+    # hash across features
+    lower_words = tuple(map(sys.intern, map(str.lower, alpha_words)))
+    
+    simple_sentences = tuple(simple_sent_split(text))
+    simple_sent_words = tuple(tuple(fast_tokens(s)) for s in simple_sentences)
+    simple_sent_word_counts = np.array(
+        [sum(map(str.isalpha, words)) for words in simple_sent_words],
+        dtype=np.int32
+    )
+    
+    word_lengths = np.fromiter((len(w) for w in alpha_words),
+                               dtype=np.int32, count=len(alpha_words))
+    syllable_counts = count_syllables_batch(alpha_words)
+    is_stop = stopword_mask(lower_words, len(lower_words))
+    for arr in (simple_sent_word_counts, word_lengths, syllable_counts, is_stop):
+        arr.flags.writeable = False
+    
+    return Tokens(sentences, sent_words, alpha_words, lower_words,
+                  simple_sentences, simple_sent_words, simple_sent_word_counts,
+                  word_lengths, syllable_counts, is_stop)
+
+
+@lru_cache(maxsize=100_000)
+def get_synsets(word: str) -> Tuple:
+    """
+    Look up WordNet synsets for a word (cached).
+    
+    Essay vocabularies are Zipfian, so the same words recur across
+    features and texts; caching avoids repeated WordNet index reads.
+    
+    Args:
+        word: Lowercased input word.
+        
+    Returns:
+        Tuple of WordNet synsets (empty if the word is unknown).
+    """
+    return tuple(wordnet.synsets(word))
+
+
+@lru_cache(maxsize=100_000)
+def primary_lemma(word: str) -> Optional[str]:
+    """
+    Return the lowercased first lemma of a word's primary WordNet sense.
+    
+    Args:
+        word: Lowercased input word.
+        
+    Returns:
+        Primary lemma name, or None if the word has no synsets.
+    """
+    synsets = get_synsets(word)
+    if not synsets:
+        return None
+    return synsets[0].lemmas()[0].name().lower()
+
+
+@lru_cache(maxsize=100_000)
+def avg_min_depth(word: str) -> Optional[float]:
+    """
+    Return the mean WordNet min_depth across a word's synsets.
+    
+    Args:
+        word: Lowercased input word.
+        
+    Returns:
+        Average synset depth, or None if the word has no synsets.
+    """
+    synsets = get_synsets(word)
+    if not synsets:
+        return None
+    return sum(s.min_depth() for s in synsets) / len(synsets)